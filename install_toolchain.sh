@@ -15,7 +15,7 @@ source ./$ENVNAME/bin/activate
 
 echo "🔧 Installing dependencies..."
 
-python3 -m pip install --upgrade PyPDF2
+python3 -m pip install --upgrade pypdf
 python3 -m pip install --upgrade pytest
 python3 -m pip install --upgrade pytest-cov
 python3 -m pip install --upgrade pytest-mock
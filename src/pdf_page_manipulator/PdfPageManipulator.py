@@ -1,35 +1,79 @@
 # Import stdlib libraries 
 import os 
-from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from io import BytesIO
+from itertools import repeat
+import operator
 
 # Import third-party libraries
-from PyPDF2 import PdfReader, PdfWriter , PaperSize
+from pypdf import PdfReader, PdfWriter , PaperSize, PageObject
 
 
-class PdfActions(Enum):
+def _load_reader(full_path: str) -> PdfReader:
+    """Parse `full_path` into a new :class:`PdfReader` owned by the caller.
+
+    The whole file is read up front in one sequential pass (as `PdfReader`
+    does for a path), with the kernel told to read ahead aggressively where
+    `posix_fadvise` is available.
+    """
+
+    with open(full_path, "rb") as input_file:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(input_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return PdfReader(BytesIO(input_file.read()))
+
+
+# PdfWriter.write emits many small chunks (one per object and xref entry);
+# a large buffer batches them into few write() syscalls per output file.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _write_pdf(writer: PdfWriter, path: str) -> None:
+    """Stream `writer` to `path` through a large write buffer."""
+
+    with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as output_file:
+        writer.write(output_file)
+
+
+def _blank_page(width: float, height: float) -> PageObject:
+    """Return a new blank page of the given size.
+
+    The page is a standalone object that is not bound to any document, so
+    building it does not allocate a writer catalog or page tree. Every insert
+    gets its own page, so editing one blank page never affects another.
+    """
+
+    return PageObject.create_blank_page(width=width, height=height)
+
+
+class PdfActions(IntEnum):
     """Enumeration of PDF manipulation actions supported by the library.
 
     Each enum value represents one high-level operation that can be performed
     by `PdfPageManipulator.__dispatch_action`. The names reflect the current
     public API methods (for example `insert_blank_first` maps to
-    `PdfActions.INSERT_BLANK_FIRST`).
+    `PdfActions.INSERT_BLANK_FIRST`). Values are small integers so comparisons
+    and lookups are plain integer operations; `PdfPageManipulator.last_method`
+    stores the member name (for example ``"INSERT_BLANK_FIRST"``).
 
     Use these values only internally; public callers should use the
     `PdfPageManipulator` convenience methods such as `insert_blank_first`.
     """
     
-    INSERT_BLANK_FIRST        = "insert_blank_first"
-    INSERT_BLANK_LAST         = "insert_blank_last"
-    ADD_BLANK_AFTER           = "add_blank_after"
-    ADD_BLANK_AT              = "add_blank_at"
-    EXTRACT_PAGES             = "extract_pages"
-    EXTRACT_RANGE             = "extract_range"
-    EXTRACT_EVENS             = "extract_evens"
-    EXTRACT_ODDS              = "extract_odds"
-    EXTRACT_EVEN_ODD_AND_SAVE = "extract_even_odd_and_save"
-    REMOVE_FIRST_PAGE         = "remove_first_page"
-    REMOVE_LAST_PAGE          = "remove_last_page"
-    REMOVE_PAGES              = "remove_pages"
+    INSERT_BLANK_FIRST        = 0
+    INSERT_BLANK_LAST         = 1
+    ADD_BLANK_AFTER           = 2
+    ADD_BLANK_AT              = 3
+    ADD_BLANKS_AT             = 4
+    EXTRACT_PAGES             = 5
+    EXTRACT_RANGE             = 6
+    EXTRACT_EVENS             = 7
+    EXTRACT_ODDS              = 8
+    EXTRACT_EVEN_ODD_AND_SAVE = 9
+    REMOVE_FIRST_PAGE         = 10
+    REMOVE_LAST_PAGE          = 11
+    REMOVE_PAGES              = 12
 
 class PageSize:
     """
@@ -60,6 +104,9 @@ class PageSize:
         set_to_A8() -> tuple: Returns A8 paper size dimensions.
         set_to_C4() -> tuple: Returns C4 paper size dimensions.
     """
+
+    # Fixed attribute layout: built for every insert without an explicit page_size
+    __slots__ = ("A0", "A1", "A2", "A3", "A4", "A5", "A6", "A7", "A8", "C4")
     
     def __init__(self):
         getPaperSize = PaperSize()
@@ -111,24 +158,34 @@ class PageSize:
 class PdfPageManipulator:
     """Manipulate PDF documents: insert, extract, remove pages and save results.
 
-    This class wraps PyPDF2 primitives to provide a small, opinionated API
+    This class wraps pypdf primitives to provide a small, opinionated API
     for common PDF page operations. It keeps an in-memory list of pages
-    (``self.pages``) and a :class:`PdfWriter` instance (``self.writer``)
-    used when writing changes back to disk.
+    (``self.pages``) and a :class:`PdfWriter` instance (``self.writer``,
+    created lazily) used when writing changes back to disk.
 
     Notes about internal state:
       - ``self.full_path`` is the path used by :meth:`load_pdf` and :meth:`save`;
         by default the filename is prefixed with ``"new_"`` when constructed.
-      - ``self.pages`` is a Python list of page objects (as returned by
-        :class:`PdfReader`). Many operations replace ``self.pages`` atomically
-        via :meth:`_op_update_pages_and_its_len` so callers can rely on
+      - ``self.pages`` starts out as the lazy ``reader.pages`` sequence of
+        :class:`PdfReader` (removing the first or last page keeps it lazy) and
+        becomes a Python list of page objects once an operation needs one.
+        Many operations replace ``self.pages`` atomically via
+        :meth:`_op_update_pages_and_its_len` so callers can rely on
         ``self.page_length``.
 
-    Public methods call :meth:`__dispatch_action`, which maps actions to small
+    Public methods call :meth:`__dispatch_action`, which routes actions to small
     helper functions. The helpers perform the page-level work (list
     comprehensions, rebuilding a writer, writing files) while dispatch keeps
     the mapping readable and unit-testable.
     """
+
+    # Fixed attribute layout: no per-instance __dict__, offset-based attribute access
+    __slots__ = (
+        "pdf_name", "path", "full_path", "save_path",
+        "_reader", "_pages", "original_pages", "_start", "_end",
+        "even_pages", "odd_pages", "_even_cache", "_odd_cache", "last_method", "_writer",
+    )
+
     # Default constructor 
     def __init__(self, pdf_name: str, path: str):
         """Initialize a new PDF manipulator instance.
@@ -152,13 +209,17 @@ class PdfPageManipulator:
         self.save_path              = os.path.join(path, "new_" + pdf_name)
     
         # Pdf Pages Variables 
-        self.pages : list           = []
-        self.page_length            = 0
+        self._reader                = None
+        self._start : int           = 0
+        self._end : int             = 0
+        self._pages : list          = []
         self.original_pages : list  = []
         self.even_pages : list      = []
         self.odd_pages : list       = []
+        self._even_cache            = None
+        self._odd_cache             = None
         self.last_method : str      = None
-        self.writer                 = PdfWriter()
+        self._writer                = None
 
 
 
@@ -167,33 +228,78 @@ class PdfPageManipulator:
     def load_pdf(self):
         """Load the PDF pointed to by `self.full_path` and cache pages.
 
-        This method reads the file using `PdfReader` and stores the pages in
-        `self.pages`. It also copies the loaded pages into
-        `self.original_pages` as a lightweight backup. After calling this the
-        instance is ready for modification operations.
+        This method reads the file using `PdfReader` and keeps the reader's
+        lazy `pages` sequence in `self.pages`. Every call parses its own
+        reader, so page objects are never shared with other instances. Page
+        objects are only resolved when an operation touches them, and the
+        sequence is turned into a list only when an operation needs one.
+        `self.original_pages` aliases the same sequence as a backup;
+        operations never mutate the loaded sequence (they rebind
+        `self.pages` or edit a private copy), so the alias keeps the loaded
+        pages without a copy. After calling this the instance is ready for
+        modification operations.
 
         Returns:
             self: the same instance (useful for chaining)
 
         Raises:
             FileNotFoundError: if the file path does not exist
-            PyPDF2.errors.PdfReadError: if the file is not a valid PDF
+            pypdf.errors.PdfReadError: if the file is not a valid PDF
         """
         
-        reader                  = PdfReader(self.full_path)
-        self.pages              = list(reader.pages)
-        self.page_length        = len(self.pages)
-        self.original_pages     = self.pages.copy()
+        self._reader            = _load_reader(self.full_path)
+        self.pages              = self._reader.pages
+        self.original_pages     = self.pages
+        self._start, self._end  = 0, len(self.pages)
+
+        # Drop any writer built for a previously loaded document; rebuilt lazily on use
+        self._writer            = None
         return self
 
 
+    @property
+    def pages(self):
+        """Current pages of the document (lazy reader sequence or list)."""
+
+        return self._pages
+
+    @pages.setter
+    def pages(self, new_pages) -> None:
+        self._pages = new_pages
+        self._op_invalidate_page_caches()
+
+    @property
+    def writer(self) -> PdfWriter:
+        """The :class:`PdfWriter` used by :meth:`save`, created on first use.
+
+        Instances that only load and inspect pages never build the writer's
+        catalog and page tree.
+        """
+
+        if self._writer is None:
+            self._writer = PdfWriter()
+        return self._writer
+
+    @writer.setter
+    def writer(self, new_writer: PdfWriter) -> None:
+        self._writer = new_writer
+
+    @property
+    def page_length(self) -> int:
+        """Number of pages in ``self.pages``.
+
+        Derived from the page list on every access, so it can never drift out
+        of sync with ``self.pages``.
+        """
+
+        return len(self._pages)
+
     def get_page_length(self) -> int:
         """Return the current number of pages in the PDF.
 
         This method provides a convenient way to access the current page count
         after any modifications have been made. It simply returns the value of
-        `self.page_length`, which is updated by all operations that modify
-        `self.pages`.
+        `self.page_length`, which is always derived from `self.pages`.
 
         Returns:
             int: The current number of pages in the PDF.
@@ -285,7 +391,8 @@ class PdfPageManipulator:
         if page_size is None:
             get_page_size = PageSize()
             page_size = get_page_size.set_to_default()
-        self.__dispatch_action(PdfActions.INSERT_BLANK_FIRST, use_buffer, index=index, page_size = page_size), 
+        self._op_insert_at(index, PdfActions.INSERT_BLANK_FIRST, page_size)
+        self.last_method = PdfActions.INSERT_BLANK_FIRST.name
 
     def insert_blank_last(self, use_buffer: bool = True, page_size: PageSize = None) -> None:
         """
@@ -303,17 +410,22 @@ class PdfPageManipulator:
         if page_size is None:
             get_page_size = PageSize()
             page_size = get_page_size.set_to_default()
-        self.__dispatch_action(PdfActions.INSERT_BLANK_LAST, use_buffer, index=index, page_size=page_size)
+        self._op_insert_at(index, PdfActions.INSERT_BLANK_LAST, page_size)
+        self.last_method = PdfActions.INSERT_BLANK_LAST.name
 
     def add_blank_after(self, page_number: int, use_buffer: bool = True, page_size: PageSize = None) -> None:
         """
         Add a blank page after the specified page number.
         Args:
             page_number (int): The page number after which to insert a blank page.
+                               Values from the last page number up to one past it append
+                               the blank page at the end.
             use_buffer (bool, optional): Whether to use buffer for the operation. Defaults to True.
             page_size (PageSize, optional): The size of the blank page to add. If None, uses the default page size. Defaults to None.
         Returns:
             None
+        Raises:
+            ValueError: If page_number is more than one past the last page (or less than 1).
         """
         
         index = page_number - 1
@@ -321,7 +433,8 @@ class PdfPageManipulator:
         if page_size is None:
             get_page_size = PageSize()
             page_size = get_page_size.set_to_default()
-        self.__dispatch_action(PdfActions.ADD_BLANK_AFTER, use_buffer, index=index, page_size = page_size)
+        self._op_insert_at(index, PdfActions.ADD_BLANK_AFTER, page_size)
+        self.last_method = PdfActions.ADD_BLANK_AFTER.name
     
     def add_blank_at(self, use_buffer: bool = True, page_number: int = None, page_size: PageSize = None) -> None:
         """
@@ -330,8 +443,8 @@ class PdfPageManipulator:
         Args:
             use_buffer (bool, optional): Whether to use the buffer for undo/redo functionality. Defaults to True.
             page_number (int, optional): The page number where the blank page should be inserted. If None, defaults to the end of the document.
-                                          - Values <= 0 insert at the beginning
-                                          - Values >= total pages insert at the end
+                                          - 1 inserts at the beginning
+                                          - Total pages + 1 appends at the end
                                           - Otherwise, inserts before the specified page number
             page_size (PageSize, optional): The size of the blank page to be added. If None, defaults to the default page size.
 
@@ -339,32 +452,71 @@ class PdfPageManipulator:
             None
 
         Raises:
-            None
+            ValueError: If page_number is less than 1 or more than one past the last page.
         """
 
-        index = page_number - 1 
+        # No page number: append at the end of the document
+        index = self.page_length if page_number is None else page_number - 1
 
         if page_size is None:
             get_page_size = PageSize()
             page_size = get_page_size.set_to_default()
-        self.__dispatch_action(PdfActions.ADD_BLANK_AT, use_buffer, index=index, page_size = page_size)
+        self._op_insert_at(index, PdfActions.ADD_BLANK_AT, page_size)
+        self.last_method = PdfActions.ADD_BLANK_AT.name
+
+
+    def add_blanks_at(self, page_list: list[int] = None, use_buffer: bool = True, page_size: PageSize = None) -> None:
+        """
+        Add a blank page before each page number in `page_list` in a single operation.
 
+        Args:
+            page_list (list[int]): Page numbers (same numbering as `add_blank_at`) before which
+                                   a blank page is inserted. All numbers refer to the document
+                                   as it is before this call, so their order does not matter.
+            use_buffer (bool, optional): Whether to use buffering. Defaults to True.
+            page_size (PageSize, optional): The size of the blank pages to add. If None, defaults to the default page size.
+
+        Example:
+            >>> pdf.add_blanks_at([2, 9, 14])  # Same result as three add_blank_at calls on the original pages
+
+        Note:
+            The page list is rebuilt once, instead of once per inserted blank page.
+
+        Raises:
+            ValueError: If page_list is None or a page number is out of range
+        """
+
+        if page_list == None:
+            raise ValueError("page_list cant' be a None, plase pass correct page_list. ex: [1, 11, 12, 19]")
+
+        if page_size is None:
+            get_page_size = PageSize()
+            page_size = get_page_size.set_to_default()
+        self._op_update_pages_and_its_len(self._op_insert_many([page_number - 1 for page_number in page_list], page_size))
+        self.last_method = PdfActions.ADD_BLANKS_AT.name
 
 
     # extract pages methods --------------------------------------------------------
     def extract_pages(self, use_buffer: bool = True, page_list: list[int] = None) -> None:
         """Extract a set of pages specified by `page_list` and replace `self.pages`.
 
-        The method uses the dispatch system which filters the current
-        `self.pages` via a list comprehension. Invalid indexes are ignored.
+        The method uses the dispatch system: the page numbers are sorted and
+        de-duplicated once, and the selected pages are fetched directly by
+        index with a single `operator.itemgetter` call, so the rest of
+        `self.pages` is never walked. Pages are kept in document order;
+        repeated and out-of-range page numbers are ignored.
 
         Args:
-            page_list (list[int]): sequence of zero-based page indexes to keep
+            page_list (list[int]): sequence of 1-based page numbers to keep
 
         Raises:
             ValueError: if `page_list` is None (method expects an explicit list)
+                        or contains a page number that is not an integer
         """
         
+        if page_list == None:
+            raise ValueError("page_list cant' be a None, plase pass correct page_list. ex: [1, 11, 12, 19]")
+
         self.__dispatch_action(PdfActions.EXTRACT_PAGES, use_buffer, page_list = page_list)
      
     def extract_range(self, use_buffer: bool = True, page_list: list[int] = None) -> None:
@@ -376,7 +528,7 @@ class PdfPageManipulator:
         Behavior:
             - Extracts pages from `start` to `end` inclusive using Python slicing
             - Replaces `self.pages` with the extracted range and updates
-              `self.page_length` via the dispatch machinery
+              `self.page_length` directly, without going through dispatch
 
         Raises:
             ValueError: if `page_list` is None or does not contain two elements
@@ -385,7 +537,10 @@ class PdfPageManipulator:
         
         from_page   = page_list[0]
         to_page     = page_list[1]
-        self.__dispatch_action(PdfActions.EXTRACT_RANGE, use_buffer, from_page = from_page, to_page = to_page)
+
+        # A range is a plain slice, so skip the dispatch machinery entirely
+        self._op_update_pages_and_its_len(self.pages[from_page - 1: to_page])
+        self.last_method = PdfActions.EXTRACT_RANGE.name
 
     def extract_evens(self, use_buffer: bool = True) -> None:
         """Extract all even-numbered pages from the PDF.
@@ -422,7 +577,7 @@ class PdfPageManipulator:
 
         This operation writes two output files directly to disk and therefore
         does not replace `self.pages`. The filenames are constructed by
-        prefixing the original filename with `even_pages_` and `odd_pages_`.
+        prefixing the original filename with `evens_pages_` and `odds_pages_`.
 
         Side effects:
             - Updates `self.even_pages` and `self.odd_pages`
@@ -465,20 +620,22 @@ class PdfPageManipulator:
             page_list (list[int]): List of page numbers to remove
             use_buffer (bool, optional): Whether to use buffering. Defaults to True.
             
-        Uses list comprehension to create a new page list excluding the specified
-        page numbers. Pages are removed in a single operation, and the remaining
-        pages are reindexed automatically.
+        The page numbers are sorted and de-duplicated once, then a single sweep
+        copies the runs of pages between them into a new page list. Pages are
+        removed in a single operation, and the remaining pages are reindexed
+        automatically.
         
         Example:
             >>> pdf.remove_pages([1, 3, 5])  # Removes pages 1, 3, and 5
         
         Note:
-            - Page numbers are 0-based (first page is 0, second is 1, etc.)
-            - Pages can be removed in any order
+            - Page numbers are 1-based (first page is 1, second is 2, etc.)
+            - Pages can be listed in any order; repeated and out-of-range numbers are ignored
             - Updates self.pages and self.page_length automatically
             
         Raises:
             ValueError: If page_list is None (the method expects an explicit list)
+                        or contains a page number that is not an integer
         """
         
         if page_list == None:
@@ -488,7 +645,7 @@ class PdfPageManipulator:
          
 
     # save pdfs methods ----------------------------------------------------------
-    def save(self, save_original = False, prefix_name: str = ""):
+    def save(self, save_original = False, prefix_name: str = "", max_pages_per_batch: int = None):
         """
         Save the PDF document to disk with optional modifications.
         Args:
@@ -496,16 +653,33 @@ class PdfPageManipulator:
                 Defaults to False.
             prefix_name (str, optional): A prefix to add to the output filename. If provided, 
                 the file will be saved with a new path using this prefix. Defaults to "".
+            max_pages_per_batch (int, optional): If provided, the pages are written as a
+                series of files of at most this many pages each instead of one file. Each
+                file gets a fresh writer, so the writer's object graph never holds more
+                than one batch. Defaults to None (a single file).
         Returns:
             None
         Raises:
             IOError: If the file cannot be written to the specified path.
+            ValueError: If max_pages_per_batch is smaller than 1.
         Notes:
             - Prepares the writer object before adding pages.
             - If prefix_name is provided, generates a new save path with the given prefix.
             - Writes the PDF to disk at self.save_path.
+            - Batches are written next to self.save_path as "part_0001_<name>.pdf",
+              "part_0002_<name>.pdf", ... (see :meth:`_get_batch_path`).
         """
 
+        if max_pages_per_batch is not None and max_pages_per_batch < 1:
+            raise ValueError(f"max_pages_per_batch should be at least 1, got {max_pages_per_batch}")
+
+        if prefix_name != "":
+            self.save_path = self._get_new_fullpath(prefix=prefix_name)
+
+        if max_pages_per_batch is not None:
+            self._save_batches(max_pages_per_batch)
+            return
+
         # Prepare self.writer for original page
         self._prepare_writer()
 
@@ -513,12 +687,27 @@ class PdfPageManipulator:
         for  page in self.pages:
             self.writer.add_page(page)
         
-        if prefix_name != "":
-            self.save_path = self._get_new_fullpath(prefix=prefix_name)
-        
         # Writing Edited  Pdf to disk
-        with open(self.save_path, "wb") as output_file:
-            self.writer.write(output_file) 
+        _write_pdf(self.writer, self.save_path)
+
+    def _save_batches(self, max_pages_per_batch: int) -> None:
+        """
+        Write ``self.pages`` as numbered files of at most `max_pages_per_batch` pages.
+        Every batch is added to a new PdfWriter that is written and dropped before the
+        next batch starts, so peak memory for the output side is bounded by the batch
+        size rather than by the document size.
+        Args:
+            max_pages_per_batch (int): Maximum number of pages per output file.
+        Returns:
+            None
+        """
+
+        page_length = self.page_length
+        for batch_number, start in enumerate(range(0, page_length, max_pages_per_batch), start=1):
+            batch_writer = PdfWriter()
+            for page in self.pages[start:start + max_pages_per_batch]:
+                batch_writer.add_page(page)
+            _write_pdf(batch_writer, self._get_batch_path(batch_number))
     
     def _save_original(self, prefix_name: str = ""):
         """
@@ -546,13 +735,53 @@ class PdfPageManipulator:
         if prefix_name != "":
             full_path = self._get_new_fullpath(prefix=prefix_name)
         
-        # Preapre Original PDF for writing to disk
+        # Prepare Original PDF for writing to disk
         for page in self.original_pages:
             self.writer.add_page(page)
     
-        # Wriring Original Pdf to disk
-        with open(full_path, "wb") as output:
-            self.writer.write(output)
+        # Writing Original Pdf to disk
+        _write_pdf(self.writer, full_path)
+
+
+    # batch methods --------------------------------------------------------------
+    @classmethod
+    def batch_apply(cls, paths: list[str], op_fn, workers: int = None) -> list[str]:
+        """Apply the same operation to many PDF files in parallel worker processes.
+
+        Every file is an independent job: a worker builds a manipulator for the
+        file, calls `load_pdf()`, runs `op_fn` on it and calls `save()`.
+        Processes are used rather than threads because PDF parsing is
+        pure-Python work that would serialize on the GIL.
+
+        Args:
+            paths (list[str]): Paths of the PDF files to process.
+            op_fn (callable): Called as ``op_fn(manipulator)`` for each loaded
+                file. It is sent to the worker processes, so it must be picklable:
+                a module-level function or a method such as
+                ``PdfPageManipulator.remove_first_page``.
+            workers (int, optional): Maximum number of worker processes.
+                Defaults to the number of CPUs.
+
+        Returns:
+            list[str]: The save path of each processed file, in the order of `paths`.
+
+        Example:
+            >>> PdfPageManipulator.batch_apply(["a.pdf", "b.pdf"], PdfPageManipulator.remove_first_page)
+            ['new_a.pdf', 'new_b.pdf']
+        """
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(cls._apply_single, paths, repeat(op_fn)))
+
+    @classmethod
+    def _apply_single(cls, path: str, op_fn) -> str:
+        """Load, modify and save one file for :meth:`batch_apply` (runs in a worker)."""
+
+        manipulator = cls(os.path.basename(path), os.path.dirname(path))
+        manipulator.load_pdf()
+        op_fn(manipulator)
+        manipulator.save()
+        return manipulator.get_save_path()
 
 
     # Private Methods
@@ -560,58 +789,107 @@ class PdfPageManipulator:
         """
         Dispatches and executes a PDF action operation based on the specified action type.
         This method serves as a central router for various PDF page manipulation operations.
-        It maps each action to a lightweight lambda function that calls the appropriate helper
-        method, executes the operation, and updates the internal state if necessary.
+        It indexes the class-level ``_HANDLERS`` tuple with the action value, calls the handler
+        method it maps to, and updates the internal state if the handler returns new pages.
         Args:
             action (PdfActions): The PDF action to be executed. Must be a valid PdfActions enum member.
             use_buffer (bool): Indicates whether to use buffering for the operation (currently unused in routing).
             **kw_args: Variable keyword arguments passed to the operation helpers. Expected keys vary by action:
-                - For INSERT_BLANK_FIRST, INSERT_BLANK_LAST, ADD_BLANK_AFTER, ADD_BLANK_AT:
-                    - index (int): The position where the blank page should be inserted.
-                    - page_size (tuple): The size of the blank page to add.
                 - For EXTRACT_PAGES: page_list (list): List of pages to extract.
-                - For EXTRACT_RANGE: from_page (int), to_page (int): Range boundaries for extraction.
                 - For REMOVE_PAGES: page_list (list): List of page indices to remove.
         Raises:
             ValueError: If the provided action is not a recognized PdfActions member.
         Side Effects:
             - Updates self.pages with the result of the operation (except for EXTRACT_EVEN_ODD_AND_SAVE).
             - Updates self.page_length to reflect the new number of pages.
-            - Sets self.last_method to the current action for tracking purposes.
+            - Sets self.last_method to the name of the current action for tracking purposes.
         Note:
             EXTRACT_EVEN_ODD_AND_SAVE is handled specially and does not update the internal pages state.
+            Blank-page inserts and EXTRACT_RANGE do not go through here; their public methods call
+            the helpers directly to avoid packing arguments into **kw_args.
         """
         
-        # Map each action to a lightweight lambda that calls the appropriate helper
-        operations = {
-            PdfActions.INSERT_BLANK_FIRST         : lambda : self._op_insert_at(kw_args["index"], PdfActions.INSERT_BLANK_FIRST, page_size = kw_args["page_size"]),
-            PdfActions.INSERT_BLANK_LAST          : lambda : self._op_insert_at(kw_args["index"], PdfActions.INSERT_BLANK_LAST, page_size = kw_args["page_size"]),
-            PdfActions.ADD_BLANK_AFTER            : lambda : self._op_insert_at(kw_args["index"], PdfActions.ADD_BLANK_AFTER, page_size = kw_args["page_size"]),
-            PdfActions.ADD_BLANK_AT               : lambda : self._op_insert_at(kw_args["index"], PdfActions.ADD_BLANK_AT, page_size = kw_args["page_size"]),
-            PdfActions.EXTRACT_PAGES              : lambda : [result for i, result in enumerate(self.pages, start=1) if i in kw_args["page_list"]], 
-            PdfActions.EXTRACT_RANGE              : lambda : self.pages[kw_args["from_page"] - 1: kw_args["to_page"]],
-            PdfActions.EXTRACT_EVENS              : lambda : [result for i, result in enumerate(self.pages, start=1) if i % 2 == 0],
-            PdfActions.EXTRACT_ODDS               : lambda : [result for i, result in enumerate(self.pages, start=1) if i % 2 != 0],
-            PdfActions.EXTRACT_EVEN_ODD_AND_SAVE  : lambda : self._op_even_odd_and_save(),
-            PdfActions.REMOVE_FIRST_PAGE          : lambda : self.pages[1:],
-            PdfActions.REMOVE_LAST_PAGE           : lambda : self.pages[:-1],
-            PdfActions.REMOVE_PAGES               : lambda : [result for i, result in enumerate(self.pages, start=1) if i not in kw_args["page_list"]],
-        }
-
-        if action not in operations:
+        # One tuple index and one call, whatever the number of actions
+        try:
+            handler = type(self)._HANDLERS[action]
+        except (IndexError, TypeError):
+            handler = None
+        if handler is None:
             raise ValueError(f"Unknown action: {action}")
-        
-        # Handle the special case for EXTRACT_EVEN_ODD_AND_SAVE which does not update self.pages
-        if action == PdfActions.EXTRACT_EVEN_ODD_AND_SAVE:
-            operations[action]()
 
+        # Update state (self.pages and self.page_length) when the handler returns new pages
+        new_pages = handler(self, **kw_args)
+        if new_pages is not None:
+            self._op_update_pages_and_its_len(new_pages)
 
-        # Run Operation and update state (self.pages and self.page_length)
-        if action != PdfActions.EXTRACT_EVEN_ODD_AND_SAVE : 
-            self._op_update_pages_and_its_len( operations[action]() )
-        
+        self.last_method = action.name
+
+    # Handler Methods for __dispatch_action (see _HANDLERS)
+    def _op_extract_pages(self, page_list: list[int]) -> list:
+        """Return the pages listed in `page_list` (1-based), in document order."""
+
+        # Fast path: an empty page list never needs to touch the pages
+        # (None is rejected by extract_pages before dispatch)
+        if not page_list:
+            return []
+
+        # Sorted unique page numbers: index them directly, O(m) instead of O(n)
+        selected_pages = self._op_normalize_page_list(page_list)
+        if len(selected_pages) < 2:
+            return [self.pages[page_number - 1] for page_number in selected_pages]
+
+        # itemgetter fetches every page in one C-level call (it returns a tuple for 2+ keys)
+        return list(operator.itemgetter(*[page_number - 1 for page_number in selected_pages])(self.pages))
+
+    # Handler Methods for __dispatch_action (see _HANDLERS)
+    def _op_remove_first_page(self) -> None:
+        """Drop the first page in place instead of copying n - 1 references into a new list."""
 
-        self.last_method = action
+        # Still a lazy view of the reader: move the window start, O(1) and nothing is copied
+        if not isinstance(self.pages, list):
+            self._start = min(self._start + 1, self._end)
+            self._op_apply_window()
+            return
+
+        pages = self._op_own_pages()
+        if pages:
+            del pages[0]
+
+    # Handler Methods for __dispatch_action (see _HANDLERS)
+    def _op_remove_last_page(self) -> None:
+        """Drop the last page in place instead of copying n - 1 references into a new list."""
+
+        # Still a lazy view of the reader: move the window end, O(1) and nothing is copied
+        if not isinstance(self.pages, list):
+            self._end = max(self._end - 1, self._start)
+            self._op_apply_window()
+            return
+
+        pages = self._op_own_pages()
+        if pages:
+            del pages[-1]
+
+    # Handler Methods for __dispatch_action (see _HANDLERS)
+    def _op_remove_pages(self, page_list: list[int]) -> list:
+        """Return the pages without those listed in `page_list` (1-based).
+
+        Returns None when nothing in range is removed, so the current pages
+        are kept untouched.
+        """
+
+        # Fast path: an empty page list never needs to walk the pages
+        removed_pages = self._op_normalize_page_list(page_list) if page_list else ()
+        if not removed_pages:
+            return None
+
+        # Two-pointer sweep: copy the runs of pages between removed page numbers
+        new_pages = []
+        previous_page = 0
+        for page_number in removed_pages:
+            new_pages.extend(self.pages[previous_page:page_number - 1])
+            previous_page = page_number
+        new_pages.extend(self.pages[previous_page:])
+        return new_pages
 
     # Helper Methods for Operations
     def _op_update_pages_and_its_len(self, new_pages: list) -> None:
@@ -620,25 +898,126 @@ class PdfPageManipulator:
         Args:
             new_pages (list): New list of pages to store
             
-        Updates both self.pages and self.page_length to maintain consistency
-        after operations that modify the page collection.
+        Updates self.pages; self.page_length is derived from it, so the two
+        stay consistent after operations that modify the page collection. Lazy sequences
+        (slices of the reader's pages) are materialized into a list here, so
+        lazy views never stack on top of each other.
+
+        ``new_pages`` must be a new sequence, never ``self.pages`` mutated in
+        place: ``self.original_pages`` aliases the loaded pages and relies on
+        them being rebound rather than changed. Operations that do edit in
+        place must go through :meth:`_op_own_pages` first.
         
         This is called automatically by __dispatch_action after each operation
         to ensure the page count stays synchronized with the actual pages.
         """
         
+        if not isinstance(new_pages, list):
+            new_pages = list(new_pages)
+
         self.pages = new_pages
-        self.page_length = len(self.pages)
 
     # Helper Methods for Operations
-    def _op_insert_at(self, index: int, op_name: PdfActions = None, **kw_args) -> list:
+    def _op_apply_window(self) -> None:
+        """Point ``self.pages`` at reader pages ``[self._start, self._end)``.
+
+        Until an operation needs a real list, ``self.pages`` is a lazy view of
+        the reader's pages described by this index window. Re-slicing the
+        reader's own sequence keeps every view one level deep, however many
+        first/last pages are trimmed.
+        """
+
+        self.pages = self._reader.pages[self._start:self._end]
+
+    # Helper Methods for Operations
+    def _op_own_pages(self) -> list:
+        """Make sure ``self.pages`` is a list this instance may edit in place.
+
+        The loaded pages are shared with ``self.original_pages`` (and are a
+        lazy reader sequence), so the first in-place edit after
+        :meth:`load_pdf` copies them into a new list once. The same happens
+        when ``self.pages`` is the list held by ``self.even_pages`` or
+        ``self.odd_pages``. Later in-place edits reuse the private list
+        without any further copy. The even/odd caches are dropped because the
+        caller is about to change the pages.
+
+        Returns:
+            list: ``self.pages``, safe to mutate.
+        """
+
+        pages = self.pages
+        shared_lists = (self.original_pages, self.even_pages, self.odd_pages)
+        if not isinstance(pages, list) or any(pages is shared for shared in shared_lists):
+            self.pages = list(pages)
+        self._op_invalidate_page_caches()
+        return self.pages
+
+    # Helper Methods for Operations
+    def _op_even_pages(self) -> list:
+        """Return the even pages of ``self.pages``, cached until the pages change.
+
+        Page numbers are 1-based, so even pages sit at indexes 1, 3, 5, ...
+        and are taken with a single stride slice.
+        """
+
+        if self._even_cache is None:
+            even_pages = self.pages[1::2]
+            self._even_cache = even_pages if isinstance(even_pages, list) else list(even_pages)
+        return self._even_cache
+
+    # Helper Methods for Operations
+    def _op_odd_pages(self) -> list:
+        """Return the odd pages of ``self.pages``, cached until the pages change.
+
+        Odd pages sit at indexes 0, 2, 4, ... of the 1-based page numbering.
+        """
+
+        if self._odd_cache is None:
+            odd_pages = self.pages[::2]
+            self._odd_cache = odd_pages if isinstance(odd_pages, list) else list(odd_pages)
+        return self._odd_cache
+
+    # Helper Methods for Operations
+    def _op_invalidate_page_caches(self) -> None:
+        """Forget the cached even/odd page lists after ``self.pages`` changes."""
+
+        self._even_cache = None
+        self._odd_cache = None
+
+    # Helper Methods for Operations
+    def _op_normalize_page_list(self, page_list: list[int]) -> tuple:
+        """Sort and de-duplicate `page_list`, dropping numbers outside the document.
+
+        Args:
+            page_list (list[int]): 1-based page numbers in any order, possibly repeated.
+
+        Returns:
+            tuple: the valid page numbers in ascending order, each once. Done once
+            per call so the filters never pay for duplicates and can walk the
+            document and the page numbers side by side.
+
+        Raises:
+            ValueError: if a page number is not an integer (the numbers are used
+            directly as indexes, so ``2.0`` is rejected rather than matched).
+        """
+
+        try:
+            page_numbers = {operator.index(page_number) for page_number in page_list or ()}
+        except TypeError:
+            raise ValueError(f"page_list should contain integer page numbers only: {page_list}") from None
+
+        page_count = len(self.pages)
+        return tuple(sorted(page_number for page_number in page_numbers if 0 < page_number <= page_count))
+
+    # Helper Methods for Operations
+    def _op_insert_at(self, index: int, op_name: PdfActions = None, page_size = None) -> None:
         """
-        Insert blank pages at specified positions in the PDF document.
-        This method modifies the internal PdfWriter by adding blank pages at various
-        positions based on the operation type specified. The document is reconstructed
-        with the blank page(s) inserted at the requested location(s).
+        Insert a blank page at the specified position in the PDF document.
+        A new blank page is inserted into ``self.pages`` in place with
+        ``list.insert`` (``list.append`` at the end), so no new page list is allocated;
+        only the first edit after loading copies the pages (see :meth:`_op_own_pages`).
         Args:
-            index (int): The position index where the blank page(s) should be inserted.
+            index (int): The position index where the blank page should be inserted.
                         Must be between 0 and the current page length (inclusive).
                         Used for ADD_BLANK_AT and ADD_BLANK_AFTER operations.
             op_name (PdfActions, optional): The operation type that determines where and how
@@ -647,10 +1026,9 @@ class PdfPageManipulator:
                                            - PdfActions.INSERT_BLANK_FIRST: Insert blank page at the beginning
                                            - PdfActions.INSERT_BLANK_LAST: Insert blank page at the end
                                            - PdfActions.ADD_BLANK_AFTER: Insert blank page after the specified index
-            **kw_args: Arbitrary keyword arguments. Expected to contain:
-                       - page_size: Object with 'width' and 'height' attributes for the blank page dimensions
+            page_size: Object with 'width' and 'height' attributes for the blank page dimensions.
         Returns:
-            list: A list of pages from the updated PdfWriter object after the blank page(s) have been inserted.
+            None
         Raises:
             ValueError: If the index is out of valid range (less than 0 or greater than current page length).
         """
@@ -658,45 +1036,49 @@ class PdfPageManipulator:
         if index > self.page_length or index < 0:
             raise ValueError(f"Index should be between 0 and {self.page_length}")
 
-        # Prepare writer - rebuild a fresh PdfWriter that we will populate
-        self.writer = PdfWriter()
+        # Add a blank page after a page index: insert behind the page at `index`
+        if op_name is PdfActions.ADD_BLANK_AFTER:
+            index = min(index + 1, self.page_length)
 
-        # Set Page Size
-        page_width = kw_args["page_size"].width;
-        page_height = kw_args["page_size"].height;
-
-        # Add a blank page by index (insert at `index`)
-        if op_name == PdfActions.ADD_BLANK_AT:
-            for i in range(self.page_length):
-                if i == index:
-                    self.writer.add_blank_page(page_width, page_height)
-                    self.writer.add_page(self.pages[i])
-                else:
-                    self.writer.add_page(self.pages[i])
-
-        # Add a blank page at the first
-        elif op_name == PdfActions.INSERT_BLANK_FIRST:
-            self.writer.add_blank_page(page_width, page_height)
-            for page in self.pages:
-                self.writer.add_page(page)
-
-        # Add a blank page at the last page
-        elif op_name == PdfActions.INSERT_BLANK_LAST:
-            for page in self.pages:
-                self.writer.add_page(page)
-            self.writer.add_blank_page(page_width, page_height)
-
-        # Add a blank page after a page index
-        elif op_name == PdfActions.ADD_BLANK_AFTER:
-            for i in range(self.page_length):
-                if i == index:
-                    self.writer.add_page(self.pages[i])
-                    self.writer.add_blank_page(page_width, page_height)
-                else:
-                    self.writer.add_page(self.pages[i])
-
-        # Return a concrete list of pages for the dispatcher to store
-        return list(self.writer.pages)
+        blank_page = _blank_page(page_size.width, page_size.height)
+        pages = self._op_own_pages()
+        if index >= len(pages):
+            pages.append(blank_page)
+        else:
+            pages.insert(index, blank_page)
+
+    # Helper Methods for Operations
+    def _op_insert_many(self, indexes: list[int], page_size = None) -> list:
+        """
+        Insert a blank page before each of the given positions in a single pass.
+        Args:
+            indexes (list[int]): Zero-based positions in the current page list. Every
+                                 position refers to the pages as they are before any
+                                 blank page is inserted; repeated positions insert
+                                 several blank pages there.
+            page_size: Object with 'width' and 'height' attributes for the blank page dimensions.
+        Returns:
+            list: A new list of pages with the blank pages inserted.
+        Raises:
+            ValueError: If any index is out of valid range (less than 0 or greater than current page length).
+
+        The new list is built with one sweep over ``self.pages``, so inserting k blank
+        pages costs O(n + k log k) instead of k separate O(n) inserts.
+        """
+
+        for index in indexes:
+            if index > self.page_length or index < 0:
+                raise ValueError(f"Index should be between 0 and {self.page_length}")
+
+        new_pages = []
+        previous_index = 0
+        for index in sorted(indexes):
+            new_pages.extend(self.pages[previous_index:index])
+            new_pages.append(_blank_page(page_size.width, page_size.height))
+            previous_index = index
+        new_pages.extend(self.pages[previous_index:])
+
+        return new_pages
 
 
     # This method is used by the dispatcher to handle the special case of extracting even and odd pages
@@ -707,36 +1089,32 @@ class PdfPageManipulator:
         Side effects:
             - Populates ``self.even_pages`` and ``self.odd_pages``
             - Writes two files to disk at paths constructed from ``self.path``
-              and ``self.pdf_name`` (prefixes "even_pages_" and "odd_pages_")
+              and ``self.pdf_name`` (prefixes "evens_pages_" and "odds_pages_")
 
         Returns:
             None
         """
         
-        # Implementation will go here
         evens_writer, odds_writer   = PdfWriter() , PdfWriter()
 
-        # Extract Evens Pages
-        self.even_pages = [result for i, result in enumerate(self.pages, start=1) if i % 2 == 0] 
-        
-        # Extract Odd Pages
-        self.odd_pages = [result for i, result in enumerate(self.pages, start=1) if i %  2 != 0] 
+        # Extract Evens and Odds Pages (cached stride slices, 1-based page numbers)
+        self.even_pages = self._op_even_pages()
+        self.odd_pages  = self._op_odd_pages()
 
-        # Prepare Evens and Odds Pages for Writing on the disk
-        for page in self.even_pages :
+        # Prepare Evens and Odds Pages for Writing on the disk from the slices above,
+        # so self.pages is not walked a second time
+        for page in self.even_pages:
             evens_writer.add_page(page)
-        
-        for page in self.odd_pages :
+        for page in self.odd_pages:
             odds_writer.add_page(page)
 
-        # Create Even and Odd Paths
+        # Create Even and Odd Paths (built per call: path and pdf_name are public and may change)
         even_fullpath = self._get_new_fullpath(prefix="evens_pages")
         odd_fullpath  = self._get_new_fullpath(prefix="odds_pages")
 
         # Write evens and odds pages on the disk
-        with open(even_fullpath, "wb") as evens_output, open(odd_fullpath, "wb") as odds_output:
-            evens_writer.write(evens_output)
-            odds_writer.write(odds_output)
+        _write_pdf(evens_writer, even_fullpath)
+        _write_pdf(odds_writer, odd_fullpath)
 
     # Helper Methods for Operations
     def _prepare_writer(self):
@@ -774,4 +1152,34 @@ class PdfPageManipulator:
         if new_path != "":
             return os.path.join(new_path, f"{prefix}_{self.pdf_name}")
         else:
-            return os.path.join(self.path, f"{prefix}_{self.pdf_name}")
\ No newline at end of file
+            return os.path.join(self.path, f"{prefix}_{self.pdf_name}")
+
+    # Helper Methods for Operations
+    def _get_batch_path(self, batch_number: int) -> str:
+        """
+        Return the output path of batch `batch_number` (1-based) for :meth:`save`.
+        Examples:
+            >>> manipulator._get_batch_path(2)
+            "./tests/part_0002_new_document.pdf"
+        """
+
+        save_dir, save_name = os.path.split(self.save_path)
+        return os.path.join(save_dir, f"part_{batch_number:04d}_{save_name}")
+
+    # Dispatch table for __dispatch_action, indexed by PdfActions value: built once
+    # with the class. None marks actions whose public methods bypass dispatch.
+    _HANDLERS = (
+        None,                   # INSERT_BLANK_FIRST
+        None,                   # INSERT_BLANK_LAST
+        None,                   # ADD_BLANK_AFTER
+        None,                   # ADD_BLANK_AT
+        None,                   # ADD_BLANKS_AT
+        _op_extract_pages,      # EXTRACT_PAGES
+        None,                   # EXTRACT_RANGE
+        _op_even_pages,         # EXTRACT_EVENS
+        _op_odd_pages,          # EXTRACT_ODDS
+        _op_even_odd_and_save,  # EXTRACT_EVEN_ODD_AND_SAVE
+        _op_remove_first_page,  # REMOVE_FIRST_PAGE
+        _op_remove_last_page,   # REMOVE_LAST_PAGE
+        _op_remove_pages,       # REMOVE_PAGES
+    )
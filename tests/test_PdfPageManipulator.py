@@ -1,5 +1,6 @@
 import os
 import pytest
+import shutil
 
 from pdf_page_manipulator import PdfPageManipulator, PageSize
 from pdf_page_manipulator.PdfPageManipulator import PdfActions
@@ -197,6 +198,66 @@ def test_add_blank_at():
     assert os.path.exists(f"./tests/{result_file_name}"), f"Expected file {result_file_name} to be created, but it does not exist."
 
 
+def test_add_blank_at_end_boundary():
+    # This test checks the boundary of add_blank_at and add_blank_after: one past the last page (or no page number for add_blank_at) appends a blank page, anything further raises a ValueError.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    original_page_length = manipulator.get_page_length()
+
+    # Given a PDF file, when I add a blank page at one past the last page,
+    # then a blank page should be appended at the end.
+    manipulator.add_blank_at(page_number=original_page_length + 1)
+    assert manipulator.get_page_length() == original_page_length + 1, f"Expected page length to be {original_page_length + 1}, but got {manipulator.get_page_length()}"
+    assert "/Contents" not in manipulator.pages[-1], "Expected the last page to be the inserted blank page"
+
+    manipulator.add_blank_after(manipulator.get_page_length() + 1)
+    assert manipulator.get_page_length() == original_page_length + 2, f"Expected page length to be {original_page_length + 2}, but got {manipulator.get_page_length()}"
+    assert "/Contents" not in manipulator.pages[-1], "Expected the last page to be the inserted blank page"
+
+    # Without a page number, add_blank_at appends at the end
+    manipulator.add_blank_at()
+    assert manipulator.get_page_length() == original_page_length + 3, f"Expected page length to be {original_page_length + 3}, but got {manipulator.get_page_length()}"
+    assert "/Contents" not in manipulator.pages[-1], "Expected the last page to be the inserted blank page"
+
+    # Page numbers further past the end are rejected and leave the pages untouched
+    with pytest.raises(ValueError):
+        manipulator.add_blank_at(page_number=manipulator.get_page_length() + 2)
+    with pytest.raises(ValueError):
+        manipulator.add_blank_after(manipulator.get_page_length() + 2)
+    assert manipulator.get_page_length() == original_page_length + 3, f"Expected page length to be {original_page_length + 3}, but got {manipulator.get_page_length()}"
+
+
+def test_add_blanks_at():
+    # This test checks if the add_blanks_at method correctly inserts a blank page before each of the specified page numbers in a single operation and increases the page length accordingly. It also checks if the new file is created after saving.
+    result_file_prefix = "test_add_blanks_at"
+    result_file_name = f"{result_file_prefix}_PPMTest.pdf"
+    page_list = [14, 2, 9]
+
+    # Given a PDF file, when I insert blank pages at a list of page numbers in the PDF, 
+    # then the page length should increase by the number of page numbers and the new file should be created.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    page_size = PageSize()
+    manipulator.load_pdf()
+    original_page_length = manipulator.get_page_length()
+    manipulator.add_blanks_at(page_list=page_list, page_size=page_size.set_to_A4())
+
+    manipulator.save(prefix_name=result_file_prefix)
+    
+    # Load the new PDF and check the page length
+    mp_test = PdfPageManipulator(result_file_name, "./tests/")
+    mp_test.load_pdf()
+    test_page_length = mp_test.get_page_length()
+
+    compare_page_length =  test_page_length - original_page_length
+    
+    # The page length should be 3 more than the original page length because we inserted 3 blank pages.
+    assert compare_page_length == len(page_list), f"Expected page length to be {original_page_length + len(page_list)}, but got {test_page_length}"
+
+    
+    # is the file created?
+    assert os.path.exists(f"./tests/{result_file_name}"), f"Expected file {result_file_name} to be created, but it does not exist."
+
+
 def test_extract_pages():
     # This test checks if the extract_pages method correctly extracts specified pages from the PDF and creates a new PDF file with the extracted pages. It also checks if the new file is created after saving.
     result_file_prefix = "test_extract_pages"
@@ -224,6 +285,22 @@ def test_extract_pages():
     assert os.path.exists(f"./tests/{result_file_name}"), f"Expected file {result_file_name} to be created, but it does not exist."
 
 
+def test_extract_pages_requires_page_list():
+    # This test checks if extract_pages rejects a missing page_list instead of emptying the document, while an explicit empty list still extracts nothing.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    original_page_length = manipulator.get_page_length()
+
+    with pytest.raises(ValueError):
+        manipulator.extract_pages()
+
+    # The document should be left untouched by the rejected call
+    assert manipulator.get_page_length() == original_page_length, f"Expected page length to be {original_page_length}, but got {manipulator.get_page_length()}"
+
+    manipulator.extract_pages(page_list=[])
+    assert manipulator.get_page_length() == 0, f"Expected page length to be 0, but got {manipulator.get_page_length()}"
+
+
 
 def test_extract_range():
     # This test checks if the extract_range method correctly extracts a range of pages from the PDF and creates a new PDF file with the extracted pages. It also checks if the new file is created after saving.
@@ -343,6 +420,22 @@ def test_extract_even_odd_and_save():
     assert os.path.exists(f"./tests/{odd_result_file_name}"), f"Expected file {odd_result_file_name} to be created, but it does not"
 
 
+def test_extract_even_odd_and_save_follows_pdf_name():
+    # This test checks if extract_even_odd_and_save builds its output paths from the current pdf_name and path, not from the values given to the constructor.
+    renamed_pdf_name = "renamed_PPMTest.pdf"
+
+    # Given a loaded PDF, when pdf_name is changed before splitting,
+    # then the split files should be named after the new pdf_name.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    manipulator.pdf_name = renamed_pdf_name
+    manipulator.extract_even_odd_and_save()
+
+    # are the files created?
+    assert os.path.exists(f"./tests/evens_pages_{renamed_pdf_name}"), f"Expected file evens_pages_{renamed_pdf_name} to be created, but it does not exist."
+    assert os.path.exists(f"./tests/odds_pages_{renamed_pdf_name}"), f"Expected file odds_pages_{renamed_pdf_name} to be created, but it does not exist."
+
+
 
 
 def test_remove_first_page():
@@ -432,6 +525,33 @@ def test_remove_pages():
 
 
 
+def test_batch_apply():
+    # This test checks if the batch_apply method correctly runs an operation on each PDF file in worker processes and saves the results. It also checks if the new file is created after saving.
+    result_file_name = "new_PPMTest.pdf"
+
+    # Given a list of PDF files, when I apply remove_first_page to them in a batch, 
+    # then each result should have one page less and the new file should be created.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    original_page_length = manipulator.get_page_length()
+    save_paths = PdfPageManipulator.batch_apply(["./tests/PPMTest.pdf"], PdfPageManipulator.remove_first_page, workers=1)
+
+    # Load the new PDF and check the page length
+    mp_test = PdfPageManipulator(result_file_name, "./tests/")
+    mp_test.load_pdf()
+    test_page_length = mp_test.get_page_length()
+
+    compare_page_length =  original_page_length - test_page_length
+
+    # The page length should be 1 less than the original page length because we removed the first page from the PDF.
+    assert compare_page_length == 1, f"Expected page length to be {original_page_length - 1}, but got {test_page_length}"
+    assert save_paths == [os.path.join("./tests", result_file_name)], f"Unexpected save paths {save_paths}"
+
+    # is the file created?
+    assert os.path.exists(f"./tests/{result_file_name}"), f"Expected file {result_file_name} to be created, but it does not exist."
+
+
+
 def test_save():
     # This test checks if the save method correctly saves the PDF file with the specified prefix name and creates a new file. It also checks if the new file is created after saving.
     result_file_prefix = "test_save"
@@ -446,3 +566,166 @@ def test_save():
     # is the file created?
     assert os.path.exists(f"./tests/{result_file_name}"), f"Expected file {result_file_name} to be created, but it does not exist."
 
+
+
+def test_save_max_pages_per_batch():
+    # This test checks if the save method with max_pages_per_batch splits the PDF into numbered files of at most that many pages. It also checks if every batch file is created after saving.
+    result_file_prefix = "test_save_batch"
+    max_pages_per_batch = 8
+
+    # Given a PDF file, when I save it with a page batch size,
+    # then one file per batch should be created and together they should hold every page.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    original_page_length = manipulator.get_page_length()
+    manipulator.save(prefix_name=result_file_prefix, max_pages_per_batch=max_pages_per_batch)
+
+    batch_count = -(-original_page_length // max_pages_per_batch)
+    batch_page_lengths = []
+    for batch_number in range(1, batch_count + 1):
+        result_file_name = f"part_{batch_number:04d}_{result_file_prefix}_PPMTest.pdf"
+
+        # is the file created?
+        assert os.path.exists(f"./tests/{result_file_name}"), f"Expected file {result_file_name} to be created, but it does not exist."
+
+        mp_test = PdfPageManipulator(result_file_name, "./tests/")
+        mp_test.load_pdf()
+        batch_page_lengths.append(mp_test.get_page_length())
+
+    # Every batch but the last one is full, and no page is lost
+    assert all(length == max_pages_per_batch for length in batch_page_lengths[:-1]), f"Unexpected batch sizes {batch_page_lengths}"
+    assert sum(batch_page_lengths) == original_page_length, f"Expected {original_page_length} pages in total, but got {sum(batch_page_lengths)}"
+    assert not os.path.exists(f"./tests/part_{batch_count + 1:04d}_{result_file_prefix}_PPMTest.pdf"), "Unexpected extra batch file"
+
+
+def test_load_pdf_isolation_and_reload():
+    # This test checks if every load_pdf call gets its own page objects, and if a file that changes on disk is parsed again on the next load.
+    result_file_name = "reload_PPMTest.pdf"
+    shutil.copyfile("./tests/PPMTest.pdf", f"./tests/{result_file_name}")
+
+    # Given two instances loading the same file, when one of them edits a page in place,
+    # then the other instance's pages and original pages should be unaffected.
+    first = PdfPageManipulator(result_file_name, "./tests/").load_pdf()
+    first.pages[0].rotate(90)
+    second = PdfPageManipulator(result_file_name, "./tests/").load_pdf()
+
+    assert second.pages[0].rotation == 0, f"Expected an unrotated first page, but got rotation {second.pages[0].rotation}"
+    assert second.original_pages[0].rotation == 0, f"Expected an unrotated original first page, but got rotation {second.original_pages[0].rotation}"
+
+    # Given a loaded file, when the file is rewritten with one page less,
+    # then loading it again should see the new page count.
+    original_page_length = second.get_page_length()
+    second.remove_first_page()
+    second.set_save_path("./tests/", result_file_name)
+    second.save()
+
+    reloaded = PdfPageManipulator(result_file_name, "./tests/").load_pdf()
+    assert reloaded.get_page_length() == original_page_length - 1, f"Expected page length to be {original_page_length - 1}, but got {reloaded.get_page_length()}"
+
+
+def test_blank_pages_are_independent():
+    # This test checks if every inserted blank page is its own page object, so editing one blank page never changes another one.
+    # Given two instances, when a blank page inserted by the first one is rotated,
+    # then blank pages inserted afterwards should not be rotated.
+    first = PdfPageManipulator("PPMTest.pdf", "./tests/").load_pdf()
+    first.insert_blank_first()
+    first.pages[0].rotate(90)
+
+    second = PdfPageManipulator("PPMTest.pdf", "./tests/").load_pdf()
+    second.add_blank_at(page_number=3)
+    second.add_blanks_at([1, 5])
+
+    blank_pages = [second.pages[0], second.pages[3], second.pages[5]]
+    assert all("/Contents" not in page for page in blank_pages), "Expected blank pages at positions 1, 4 and 6"
+    assert all(page.rotation == 0 for page in blank_pages), f"Expected unrotated blank pages, but got rotations {[page.rotation for page in blank_pages]}"
+    assert len({id(page) for page in blank_pages}) == len(blank_pages), "Expected every blank page to be a separate page object"
+
+
+def test_trims_and_inserts_keep_original_pages():
+    # This test checks if trimming and inserting pages never changes original_pages, and if the remaining pages are the original page objects themselves.
+    result_file_prefix = "test_save_original"
+    result_file_name = f"{result_file_prefix}_PPMTest.pdf"
+
+    # Given a loaded PDF, when pages are trimmed from both ends and a blank page is inserted,
+    # then the remaining pages should be the original ones and original_pages should be untouched.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    for _ in range(3):
+        manipulator.remove_first_page()
+    manipulator.remove_last_page()
+    manipulator.insert_blank_first()
+
+    original_pages = manipulator.original_pages
+    kept_pages = list(manipulator.pages[1:])
+    expected_pages = list(original_pages[3:19])
+
+    assert len(original_pages) == 20, f"Expected 20 original pages, but got {len(original_pages)}"
+    assert len(kept_pages) == len(expected_pages), f"Expected {len(expected_pages)} kept pages, but got {len(kept_pages)}"
+    assert all(kept is expected for kept, expected in zip(kept_pages, expected_pages)), "Expected the kept pages to be original pages 4 to 19"
+
+    # Saving the original should still write every loaded page
+    manipulator._save_original(prefix_name=result_file_prefix)
+    mp_test = PdfPageManipulator(result_file_name, "./tests/")
+    mp_test.load_pdf()
+    assert mp_test.get_page_length() == 20, f"Expected page length to be 20, but got {mp_test.get_page_length()}"
+
+
+def test_edits_do_not_reach_even_pages():
+    # This test checks if editing the pages after extract_evens does not change the even_pages list filled by extract_even_odd_and_save.
+    # Given even pages split off the document, when the evens are extracted and the last page is removed,
+    # then even_pages should still hold every even page.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    manipulator.extract_even_odd_and_save()
+    manipulator.extract_evens()
+    manipulator.remove_last_page()
+
+    assert manipulator.get_page_length() == 9, f"Expected page length to be 9, but got {manipulator.get_page_length()}"
+    assert len(manipulator.even_pages) == 10, f"Expected 10 even pages, but got {len(manipulator.even_pages)}"
+
+
+def test_extract_evens_after_trim_uses_current_pages():
+    # This test checks if extract_evens works on the current pages after a trim, instead of returning even pages cached before it.
+    # Given a document whose even pages were already computed, when the first page is removed,
+    # then extract_evens should pick every second page of the trimmed document.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    manipulator.extract_even_odd_and_save()
+    manipulator.remove_first_page()
+    manipulator.extract_evens()
+
+    # The trimmed document starts at original page 2, so its even pages are original pages 3, 5, ..., 19
+    expected_pages = list(manipulator.original_pages[2:19:2])
+    extracted_pages = list(manipulator.pages)
+    assert len(extracted_pages) == len(expected_pages), f"Expected {len(expected_pages)} pages, but got {len(extracted_pages)}"
+    assert all(extracted is expected for extracted, expected in zip(extracted_pages, expected_pages)), "Expected the even pages of the trimmed document"
+
+
+def test_page_lists_in_any_order():
+    # This test checks if remove_pages and extract_pages accept unsorted, repeated and out-of-range page numbers, and if they keep exactly the expected pages.
+    # Given a loaded PDF, when pages are removed with an unsorted list holding duplicates and out-of-range numbers,
+    # then only pages 1, 2 and 5 should be removed.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    original_pages = list(manipulator.original_pages)
+    manipulator.remove_pages([5, 1, 5, 99, 0, -3, 2])
+
+    expected_pages = [original_pages[page_number - 1] for page_number in range(1, 21) if page_number not in (1, 2, 5)]
+    assert manipulator.get_page_length() == 17, f"Expected page length to be 17, but got {manipulator.get_page_length()}"
+    assert all(kept is expected for kept, expected in zip(manipulator.pages, expected_pages)), "Expected original pages 3, 4, 6, ..., 20"
+
+    # Given a loaded PDF, when pages are extracted with an unsorted list holding duplicates and out-of-range numbers,
+    # then pages 3 and 9 should be kept, in document order.
+    manipulator = PdfPageManipulator("PPMTest.pdf", "./tests/")
+    manipulator.load_pdf()
+    original_pages = list(manipulator.original_pages)
+    manipulator.extract_pages(page_list=[9, 3, 3, 100])
+
+    assert manipulator.get_page_length() == 2, f"Expected page length to be 2, but got {manipulator.get_page_length()}"
+    assert manipulator.pages[0] is original_pages[2] and manipulator.pages[1] is original_pages[8], "Expected original pages 3 and 9"
+
+    # Page numbers must be integers
+    with pytest.raises(ValueError):
+        manipulator.extract_pages(page_list=[2.0, 3.0])
+    with pytest.raises(ValueError):
+        manipulator.remove_pages([1.5])